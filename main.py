@@ -33,11 +33,19 @@
 # - Forza Horizon 5
 
 import sys
+import os
+import errno
+import select
 import socket
+import ctypes
+import ctypes.util
 import threading
+import queue
+import time
 import traceback
 import logging
 from datetime import datetime
+from array import array
 from collections import deque
 from PySide6.QtCore import Qt, Signal, QObject, QMargins, QPointF, QTimer
 from PySide6.QtWidgets import (
@@ -45,10 +53,17 @@ from PySide6.QtWidgets import (
     QTabWidget, QLabel, QTextEdit, QLineEdit, QGridLayout, QSlider, QFileDialog
 )
 from PySide6.QtCharts import QChart, QChartView, QLineSeries, QValueAxis
-from PySide6.QtGui import QPainter
-from struct import unpack
+from PySide6.QtGui import QOpenGLContext
+from struct import Struct, calcsize, error as StructError
+from operator import itemgetter
 import csv
 
+try:
+    # Optional: lets charts bulk-load points through QXYSeries.replaceNp
+    import numpy as np
+except ImportError:
+    np = None
+
 logging.basicConfig(
     level=logging.DEBUG,
     format="%(asctime)s [%(levelname)s] %(message)s",
@@ -103,77 +118,242 @@ class ForzaDataPacket:
         'norm_driving_line', 'norm_ai_brake_diff'
     ]
 
-    dash_format = '<iIfffffffffffffffffffffffffffffffffffffffffffffffffffiiiiifffffffffffffffffHBBBBBBbbb'
+    # Sled block is bytes 0..232; FH5 inserts 12 extra bytes before the dash block at 244..323.
+    sled_fields = 'iI' + 'f' * 51 + 'iiiii'
+    dash_fields = 'f' * 17 + 'HBBBBBBbbb'
+    sled_struct = Struct('<' + sled_fields)
+    dash_offset = 244
 
     @classmethod
     def get_props(cls):
         return cls.sled_props + cls.dash_props
 
-    def __init__(self, data: bytes):
-        if len(data) < 232:
-            raise ValueError("Incomplete packet received")
+    @classmethod
+    def make_parser(cls, props):
+        # Builds parse(data) -> tuple of just `props`, in that order. Unwanted fields become
+        # pad bytes in a single Struct, so they are skipped in C instead of being unpacked.
+        wanted = set(props)
+        fields = list(zip(cls.sled_props, cls.sled_fields)) + [(None, f'{cls.dash_offset - cls.sled_struct.size}x')]
+        fields += list(zip(cls.dash_props, cls.dash_fields))
+
+        fmt = '<'
+        pad = 0
+        unpacked = []
+        for prop, code in fields:
+            if prop in wanted:
+                if pad:
+                    fmt += f'{pad}x'
+                    pad = 0
+                fmt += code
+                unpacked.append(prop)
+            else:
+                pad += calcsize(code)
+        if pad:
+            fmt += f'{pad}x'
+
+        unpack_from = Struct(fmt).unpack_from
+        pick = itemgetter(*[unpacked.index(prop) for prop in props])
+        if len(props) == 1:
+            single = pick
+            pick = lambda vals: (single(vals),)
+
+        def parse(data):
+            try:
+                return pick(unpack_from(data, 0))
+            except StructError as e:
+                raise ValueError(f"Unpack failed: {e}") from None
+
+        return parse
+
+# Linux recvmmsg() structures, used to drain several datagrams per syscall.
+MSG_WAITFORONE = 0x10000
+RECV_BATCH = 32
+RECV_BUF_SIZE = 1024
+# Kernel-side headroom so GC pauses or UI stalls don't drop packets (Linux caps this at net.core.rmem_max).
+RECV_SOCKET_BUFFER = 4 * 1024 * 1024
+# Parsed packets are held back until this many arrive or the oldest is this old, then emitted together.
+EMIT_BATCH = 16
+EMIT_INTERVAL = 0.02
+
+class IOVec(ctypes.Structure):
+    _fields_ = [
+        ('iov_base', ctypes.c_void_p),
+        ('iov_len', ctypes.c_size_t),
+    ]
 
-        patched_data = data[:232] + data[244:323]
-        try:
-            vals = unpack(self.dash_format, patched_data)
-        except Exception as e:
-            raise ValueError(f"Unpack failed: {e}")
+class MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_name', ctypes.c_void_p),
+        ('msg_namelen', ctypes.c_uint32),
+        ('msg_iov', ctypes.POINTER(IOVec)),
+        ('msg_iovlen', ctypes.c_size_t),
+        ('msg_control', ctypes.c_void_p),
+        ('msg_controllen', ctypes.c_size_t),
+        ('msg_flags', ctypes.c_int),
+    ]
 
-        for prop_name, prop_value in zip(self.get_props(), vals):
-            setattr(self, prop_name, prop_value)
+class MMsgHdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_hdr', MsgHdr),
+        ('msg_len', ctypes.c_uint),
+    ]
 
-    def to_dict(self):
-        return {prop: getattr(self, prop) for prop in self.get_props()}
+def _load_recvmmsg():
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        func = libc.recvmmsg
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = [ctypes.c_int, ctypes.POINTER(MMsgHdr), ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+    func.restype = ctypes.c_int
+    return func
+
+recvmmsg = _load_recvmmsg()
+
+class BatchReader:
+    def __init__(self, sock, batch=RECV_BATCH, size=RECV_BUF_SIZE):
+        self.fd = sock.fileno()
+        self.size = size
+        # One flat buffer sliced per message; the ctypes view pins it for the kernel writes.
+        self.buf = bytearray(batch * size)
+        self.view = memoryview(self.buf)
+        self._cbuf = (ctypes.c_char * len(self.buf)).from_buffer(self.buf)
+        self.iovecs = (IOVec * batch)()
+        self.hdrs = (MMsgHdr * batch)()
+
+        base = ctypes.addressof(self._cbuf)
+        for i in range(batch):
+            self.iovecs[i].iov_base = base + i * size
+            self.iovecs[i].iov_len = size
+            self.hdrs[i].msg_hdr.msg_iov = ctypes.pointer(self.iovecs[i])
+            self.hdrs[i].msg_hdr.msg_iovlen = 1
+
+    def read(self):
+        count = recvmmsg(self.fd, self.hdrs, len(self.hdrs), MSG_WAITFORONE, None)
+        if count < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return []
+            raise OSError(err, os.strerror(err))
+
+        size = self.size
+        return [
+            self.view[i * size:i * size + self.hdrs[i].msg_len]
+            for i in range(count)
+        ]
+
+# Display conversions applied to raw packet values before charting/logging,
+# as (scale, clamp_at_zero) pairs.
+PATCH_MAP = {
+    'accel': (100 / 255, False),
+    'brake': (100 / 255, False),
+    'clutch': (100 / 255, False),
+    'handbrake': (100 / 255, False),
+    'steer': (100 / 127, False),
+    'speed': (2.23694, False),
+    'power': (1 / 745.7, False),
+    'torque': (1.0, True),
+    'boost': (1.0, True)
+}
+NO_PATCH = (1.0, False)
 
 class TelemetryReceiver(QObject):
-    data_received = Signal(dict)
+    # One list per prop, already scaled for display, plus each packet's epoch receive time
+    data_received_batch = Signal(list, list)
     log_message = Signal(str)
 
-    def __init__(self, ip="0.0.0.0", port=5607):
+    def __init__(self, ip="0.0.0.0", port=5607, props=None):
         super().__init__()
         self.ip = ip
         self.port = port
+        # Emitted columns follow `props` order (every packet field by default)
+        self.props = tuple(props or ForzaDataPacket.get_props())
+        self.parse = ForzaDataPacket.make_parser(self.props)
+        self.patches = [PATCH_MAP.get(prop, NO_PATCH) for prop in self.props]
         self._running = False
         self.sock = None
         self.thread = None
+        self._wakeup = None
+        self._err_count = 0
 
     def start(self):
         if self._running:
             return
         self._running = True
-        self.thread = threading.Thread(target=self._listen_loop, daemon=True)
+        # stop() writes to this pair to wake the listener, which otherwise blocks with no timeout
+        self._wakeup = socket.socketpair()
+        self.thread = threading.Thread(target=self._listen_loop, args=(self._wakeup,), daemon=True)
         self.thread.start()
         log.info(f"Started UDP listener on {self.ip}:{self.port}")
         self.log_message.emit(f"Started UDP listener on {self.ip}:{self.port}")
 
     def stop(self):
         self._running = False
-        try:
-            if self.sock:
-                self.sock.shutdown(socket.SHUT_RDWR)
-                self.sock.close()
-        except Exception:
-            pass
+        if self._wakeup:
+            try:
+                self._wakeup[1].send(b'\0')
+            except OSError:
+                pass
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join(timeout=2.0)
         log.info("Stopped UDP listener")
         self.log_message.emit("Stopped UDP listener")
 
-    def _listen_loop(self):
+    def _listen_loop(self, wakeup):
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_SOCKET_BUFFER)
             self.sock.bind((self.ip, self.port))
-            self.sock.settimeout(1.0)
+            self.sock.setblocking(False)
+            rcvbuf = self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+            log.info(f"UDP receive buffer: {rcvbuf} bytes")
+            self.log_message.emit(f"UDP receive buffer: {rcvbuf} bytes")
         except Exception as e:
             log.error(f"Socket error: {e}")
             self.log_message.emit(f"Socket error: {e}")
             self._running = False
+            self._close_sockets(wakeup)
             return
 
+        reader = BatchReader(self.sock) if recvmmsg else None
+        # Fallback path reuses one buffer; packets are parsed before the next receive overwrites it
+        rxview = memoryview(bytearray(RECV_BUF_SIZE))
+        watched = [self.sock, wakeup[0]]
+        pending = []
+        stamps = []
+        deadline = None
+
         while self._running:
             try:
-                data, addr = self.sock.recvfrom(1024)
-                packet = ForzaDataPacket(data)
-                self.data_received.emit(packet.to_dict())
-            except socket.timeout:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                ready, _, _ = select.select(watched, [], [], timeout)
+                if self.sock in ready:
+                    if reader:
+                        datagrams = reader.read()
+                    else:
+                        size = self.sock.recv_into(rxview)
+                        datagrams = (rxview[:size],)
+                    # Packets drained by one receive call share its timestamp
+                    received = time.time()
+
+                    for data in datagrams:
+                        try:
+                            pending.append(self.parse(data))
+                            stamps.append(received)
+                        except ValueError as e:
+                            log.error(f"Recv error: {e}")
+                            self.log_message.emit(f"Recv error: {e}")
+                    if pending and deadline is None:
+                        deadline = time.monotonic() + EMIT_INTERVAL
+
+                if pending and (len(pending) >= EMIT_BATCH or time.monotonic() >= deadline):
+                    self.data_received_batch.emit(self.to_columns(pending), stamps)
+                    pending = []
+                    stamps = []
+                    deadline = None
+            except BlockingIOError:
                 continue
             except OSError as e:
                 if not self._running:
@@ -181,9 +361,100 @@ class TelemetryReceiver(QObject):
                 log.error(f"Recv OSError: {e}")
                 self.log_message.emit(f"Recv OSError: {e}")
             except Exception as e:
-                log.error(f"Recv error: {e}\n{traceback.format_exc()}")
+                if not self._running:
+                    break
+                # Full tracebacks only for the first error and every 256th after it
+                self._err_count += 1
+                if self._err_count & 0xFF == 1:
+                    log.error(f"Recv error: {e!r}\n{traceback.format_exc()}")
+                else:
+                    log.error(f"Recv error: {e!r}")
                 self.log_message.emit(f"Recv error: {e}")
 
+        self._close_sockets(wakeup)
+
+    def to_columns(self, batch):
+        # Transpose parsed packets into columns and apply the display patches here, off the GUI thread.
+        columns = []
+        for col, (scale, clamp) in zip(zip(*batch), self.patches):
+            if scale != 1.0:
+                col = [v * scale for v in col]
+            if clamp:
+                col = [v if v > 0 else 0.0 for v in col]
+            columns.append(col)
+        return columns
+
+    def _close_sockets(self, wakeup):
+        for sock in (self.sock, *wakeup):
+            try:
+                if sock:
+                    sock.close()
+            except OSError:
+                pass
+
+# Smallest y-bound change worth a chart relayout
+AXIS_EPSILON = 1e-6
+
+_opengl_ok = None
+
+def opengl_available():
+    global _opengl_ok
+    if _opengl_ok is None:
+        _opengl_ok = QOpenGLContext().create()
+    return _opengl_ok
+
+def to_float32(vals):
+    if isinstance(vals, array) and vals.typecode == 'f':
+        return vals
+    return array('f', vals)
+
+class RingBuffer:
+    # Fixed-capacity sliding window of float32 samples kept contiguous in an array('f').
+    def __init__(self, capacity, values=()):
+        self.capacity = capacity
+        self.buf = array('f', bytes(4 * capacity))
+        self.head = 0
+        self.size = 0
+        self.extend(values)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return iter(self.view())
+
+    def append(self, val):
+        self.buf[self.head] = val
+        self.head = (self.head + 1) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+
+    def extend(self, vals):
+        vals = to_float32(vals)
+        cap = self.capacity
+        n = len(vals)
+        if n >= cap:
+            self.buf[:] = vals[n - cap:]
+            self.head = 0
+            self.size = cap
+            return
+
+        first = min(n, cap - self.head)
+        self.buf[self.head:self.head + first] = vals[:first]
+        self.buf[:n - first] = vals[first:]
+        self.head = (self.head + n) % cap
+        self.size = min(self.size + n, cap)
+
+    def view(self):
+        # Samples oldest-first; until the ring first wraps they are simply buf[:size].
+        if self.size < self.capacity:
+            return self.buf[:self.size]
+        return self.buf[self.head:] + self.buf[:self.head]
+
+    def clear(self):
+        self.head = 0
+        self.size = 0
+
 class TelemetryChart(QWidget):
     def __init__(self, title, parent=None):
         super().__init__(parent)
@@ -191,13 +462,14 @@ class TelemetryChart(QWidget):
         self.title = title
 
         layout = QVBoxLayout(self)
+        # No antialiasing: smoothing dozens of constantly scrolling lines costs more than it shows
         self.chart_view = QChartView()
-        self.chart_view.setRenderHint(QPainter.Antialiasing)
         layout.addWidget(self.chart_view)
 
         self.chart = QChart()
         self.chart.setTitle(self.title.replace('_', ' ').title())
         self.chart.legend().hide()
+        self.chart.setAnimationOptions(QChart.NoAnimation)
         self.chart_view.setChart(self.chart)
 
         self.setContentsMargins(0, 0, 0, 0)
@@ -206,6 +478,8 @@ class TelemetryChart(QWidget):
         self.chart.setMargins(QMargins(0, 0, 0, 0))
 
         self.series = QLineSeries()
+        # Draw the line through OpenGL when a context can be created; GL series are not drawn at all otherwise
+        self.series.setUseOpenGL(opengl_available())
         self.chart.addSeries(self.series)
 
         self.axis_x = QValueAxis()
@@ -223,36 +497,129 @@ class TelemetryChart(QWidget):
         self.series.attachAxis(self.axis_y)
 
         self.buffer_len = 150
-        self.data = deque(maxlen=self.buffer_len)
+        self.data = RingBuffer(self.buffer_len)
+        self._alloc_points()
+        # Sliding-window extremes: monotonic (sample_index, value) queues whose fronts
+        # are the current min and max, so the range never needs a full rescan.
+        self._pushed = 0
+        self._min_dq = deque()
+        self._max_dq = deque()
+        self._y_range = None
+        self._x_range = None
+        # Points are plotted at their absolute sample index (matching the app's sample count), so new
+        # samples can be appended to the series and old ones trimmed off the front instead of
+        # rewriting the whole window.
+        self._series_synced = True
 
     def set_buffer_len(self, length):
         self.buffer_len = length
-        old_data = list(self.data)[-length:]
-        self.data = deque(old_data, maxlen=self.buffer_len)
-
-    def add_values(self, vals):
+        self.data = RingBuffer(self.buffer_len, self.data.view()[-length:])
+        self._alloc_points()
+        self._evict_extremes()
+        self._series_synced = False
+
+    def add_values(self, vals, skipped=0):
+        if skipped:
+            # Samples were dropped before `vals` (hidden tab), so anything still charted predates the gap
+            self.data.clear()
+            self._min_dq.clear()
+            self._max_dq.clear()
+            self._pushed += skipped
+            self._series_synced = False
+        vals = to_float32(vals)
         self.data.extend(vals)
-        points = [QPointF(i, v) for i, v in enumerate(self.data)]
-        self.series.replace(points)
-
+        min_dq, max_dq = self._min_dq, self._max_dq
+        first = idx = self._pushed
+        for v in vals:
+            while min_dq and min_dq[-1][1] >= v:
+                min_dq.pop()
+            min_dq.append((idx, v))
+            while max_dq and max_dq[-1][1] <= v:
+                max_dq.pop()
+            max_dq.append((idx, v))
+            idx += 1
+        self._pushed = idx
+        self._evict_extremes()
+
+        if self._series_synced and len(vals) < self.buffer_len:
+            self._append_points(first, vals)
+        else:
+            self._redraw()
+        self._update_axes()
+
+    def set_values(self, vals, first=0):
+        self.data.clear()
+        self._min_dq.clear()
+        self._max_dq.clear()
+        self._pushed = first
+        self._series_synced = False
+        self.add_values(vals)
+
+    def clear(self):
+        self.set_values(())
+
+    def _evict_extremes(self):
+        oldest = self._pushed - len(self.data)
+        while self._min_dq and self._min_dq[0][0] < oldest:
+            self._min_dq.popleft()
+        while self._max_dq and self._max_dq[0][0] < oldest:
+            self._max_dq.popleft()
+
+    def _alloc_points(self):
+        if np is None:
+            # Reused for full redraws; the series copies them on replace.
+            self._points = [QPointF(i, 0.0) for i in range(self.buffer_len)]
+
+    def _append_points(self, first, vals):
+        excess = self.series.count() + len(vals) - self.buffer_len
+        if excess > 0:
+            self.series.removePoints(0, excess)
+        if np is not None:
+            self.series.appendNp(np.arange(first, first + len(vals), dtype=np.float64),
+                                 np.frombuffer(vals, dtype=np.float32).astype(np.float64))
+        else:
+            self.series.append([QPointF(first + i, v) for i, v in enumerate(vals)])
+
+    def _redraw(self):
+        first = self._pushed - len(self.data)
+        if np is not None:
+            # Hand the whole window to Qt in one call instead of one QPointF per sample. Both arrays
+            # must share a dtype, and float64 keeps large sample indices exact (Qt stores qreal anyway).
+            ys = np.frombuffer(self.data.view(), dtype=np.float32).astype(np.float64)
+            self.series.replaceNp(np.arange(first, self._pushed, dtype=np.float64), ys)
+        else:
+            points = self._points
+            for x, (point, v) in enumerate(zip(points, self.data), first):
+                point.setX(x)
+                point.setY(v)
+            self.series.replace(points[:len(self.data)])
+        self._series_synced = True
+
+    def _update_axes(self):
         if self.data:
-            mn, mx = min(self.data), max(self.data)
+            mn, mx = self._min_dq[0][1], self._max_dq[0][1]
             if mn == mx:
                 mn -= 0.1
                 mx += 0.1
-            self.axis_y.setRange(mn, mx)
-            self.axis_x.setRange(0, len(self.data))
+            # Re-ranging an axis relayouts the chart, so only do it when the bounds actually moved
+            last = self._y_range
+            if last is None or abs(mn - last[0]) > AXIS_EPSILON or abs(mx - last[1]) > AXIS_EPSILON:
+                self._y_range = (mn, mx)
+                self.axis_y.setRange(mn, mx)
+            x_range = (self._pushed - len(self.data), self._pushed)
+            if x_range != self._x_range:
+                self._x_range = x_range
+                self.axis_x.setRange(*x_range)
 
 class ForzaTelemetryApp(QWidget):
+    # Raised from the data log writer thread when it gives up on the file; carries that session's queue
+    log_write_failed = Signal(str, object)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("FH5 Telemetry")
         self.setStyleSheet("background-color: #121212; color: #808080;")
 
-        self.receiver = TelemetryReceiver(ip="0.0.0.0", port=5607)
-        self.receiver.data_received.connect(self.buffer_data)
-        self.receiver.log_message.connect(self.log)
-
         main_layout = QVBoxLayout(self)
 
         self.tabs = QTabWidget()
@@ -265,8 +632,17 @@ class ForzaTelemetryApp(QWidget):
         self.log_panel.setMaximumHeight(120)
         self._auto_scroll = True
         self.log_panel.setStyleSheet("background-color: #222; color: #ccc; font-family: Consolas; font-size: 11px;")
+        # Oldest lines are dropped so appends don't slow down as the session grows
+        self.log_panel.document().setMaximumBlockCount(500)
         main_layout.addWidget(self.log_panel)
 
+        # Messages are coalesced and appended to the panel at most 4x/sec
+        self._log_pending = []
+        self.log_timer = QTimer(self)
+        self.log_timer.setSingleShot(True)
+        self.log_timer.setInterval(250)
+        self.log_timer.timeout.connect(self._drain_log)
+
         controls = QHBoxLayout()
         main_layout.addLayout(controls)
 
@@ -282,6 +658,7 @@ class ForzaTelemetryApp(QWidget):
         self.btn_toggle_log = QPushButton("Start Data Log")
         self.btn_toggle_log.setCheckable(True)
         self.btn_toggle_log.clicked.connect(self.toggle_logging)
+        self.log_write_failed.connect(self._on_log_write_failed)
         controls.addWidget(self.btn_toggle_log)
 
         controls.addStretch()
@@ -309,16 +686,39 @@ class ForzaTelemetryApp(QWidget):
         controls.addWidget(self.btn_open_log)
 
         self.sample_count = 0
-        self.data_buffer = {k: deque() for k in self.charts.keys()}
+        self._clock_sec = None
+        self._clock_str = ''
+        # Pending samples per key between chart refreshes, stored as float32 like the chart rings.
+        self.data_buffer = {k: array('f') for k in self.charts.keys()}
+
+        # The receiver only unpacks the charted fields plus is_race_on, in data_buffer order.
+        self.receiver = TelemetryReceiver(ip="0.0.0.0", port=5607, props=list(self.data_buffer) + ['is_race_on'])
+        self.receiver.data_received_batch.connect(self.buffer_data)
+        self.receiver.log_message.connect(self.log)
+
+        self._race_on_idx = len(self.data_buffer)
+        self._pending = list(self.data_buffer.values())
+        # Samples trimmed from each hidden chart's pending buffer, so its x axis stays on sample_count
+        self._skipped = dict.fromkeys(self.data_buffer, 0)
 
         self.update_timer = QTimer(self)
         self.update_timer.setInterval(80)
         self.update_timer.timeout.connect(self.flush_data_buffer)
 
+        # Only charts on the shown tab are redrawn; the rest catch up when their tab is selected
+        self._tab_keys = [set(keys) for keys in self.categories.values()]
+        self._visible_keys = set()
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+        self._on_tab_changed(self.tabs.currentIndex())
+
         self.logging_enabled = False
         self.log_file = None
-        self.csv_writer = None
-        self.csv_lock = threading.Lock()
+        self.log_queue = None
+        self.log_thread = None
+        # Logged columns, fixed once so the header and row template always line up.
+        # All logged fields are numeric, so rows are formatted directly instead of through csv.writer.
+        self._csv_keys = tuple(self.data_buffer.keys())
+        self._row_fmt = ','.join(['%.3f'] + ['%.6f'] * len(self._csv_keys)) + '\r\n'
 
     def _setup_charts(self):
         self.categories = {
@@ -360,57 +760,82 @@ class ForzaTelemetryApp(QWidget):
                 grid.addWidget(chart, row, col)
             self.tabs.addTab(tab, cat)
 
-    def buffer_data(self, data: dict):
-        self.sample_count += 1
-
-        def scale_controls(val): return val * 100 / 255
-        def norm_steer(val): return val * 100 / 127
-        def to_mph(val): return val * 2.23694
-        def to_hp(val): return val / 745.7
-        def clamp_zero(val): return max(val, 0)
-
-        patch_map = {
-            'accel': scale_controls,
-            'brake': scale_controls,
-            'clutch': scale_controls,
-            'handbrake': scale_controls,
-            'steer': norm_steer,
-            'speed': to_mph,
-            'power': to_hp,
-            'torque': clamp_zero,
-            'boost': clamp_zero
-        }
+    def buffer_data(self, columns: list, stamps: list):
+        prev_count = self.sample_count
+        self.sample_count += len(columns[0])
 
-        raw_snapshot = {}
-        minmax_info = []
-
-        for key, val in data.items():
-            if key in self.data_buffer and isinstance(val, (int, float)):
-                fixed_val = patch_map[key](val) if key in patch_map else val
-                self.data_buffer[key].append(fixed_val)
-                raw_snapshot[key] = fixed_val
-                minmax_info.append(f"{key} = {fixed_val:.2f}")
+        # Columns arrive scaled from the receiver thread; each key is a single extend.
+        for buf, col in zip(self._pending, columns):
+            buf.extend(col)
 
         if self.logging_enabled:
-            self._log_to_file(raw_snapshot)
-
-        if self.sample_count % 100 == 0:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            race_on = data.get('is_race_on', False)
-            log.info(f"[{timestamp}] Sample {self.sample_count}, Race On: {race_on}")
-            for line in minmax_info:
-                log.info(f"  {line}")
+            self._log_to_file(zip(stamps, *columns[:self._race_on_idx]))
+
+        if self.sample_count // 100 > prev_count // 100:
+            timestamp = self._clock()
+            race_on = columns[self._race_on_idx][-1]
+            minmax_info = [f"{key} = {col[-1]:.2f}" for key, col in zip(self.data_buffer, columns)]
+            if log.isEnabledFor(logging.INFO):
+                log.info("[%s] Sample %d, Race On: %s", timestamp, self.sample_count, race_on)
+                for line in minmax_info:
+                    log.info("  %s", line)
             self.log(f"[{timestamp}] Sample {self.sample_count}, Race On: {race_on}\n" + "\n".join(minmax_info))
 
-    def _log_to_file(self, data_dict):
-        with self.csv_lock:
-            if self.csv_writer:
-                # Write a row with timestamp and all keys in data_buffer
-                row = [datetime.now().isoformat()]
-                for key in self.data_buffer.keys():
-                    row.append(data_dict.get(key, ''))
-                self.csv_writer.writerow(row)
-                self.log_file.flush()
+    def _clock(self):
+        # HH:MM:SS for the sample dump, re-formatted only when the second rolls over
+        now = int(time.time())
+        if now != self._clock_sec:
+            self._clock_sec = now
+            self._clock_str = time.strftime("%H:%M:%S", time.localtime(now))
+        return self._clock_str
+
+    def _log_to_file(self, rows):
+        # Rows are (receive_time, *values in _csv_keys order), formatted on the writer thread
+        self.log_queue.put(rows)
+
+    def _log_writer_loop(self, log_file, log_queue):
+        # Sole owner of log_file while logging; a None item closes the file and ends the thread.
+        row_fmt = self._row_fmt
+        last_flush = time.monotonic()
+        done = False
+        error = None
+        try:
+            while not done:
+                chunks = []
+                try:
+                    item = log_queue.get(timeout=1.0)
+                    while item is not None:
+                        chunks.extend([row_fmt % row for row in item])
+                        item = log_queue.get_nowait()
+                    done = True
+                except queue.Empty:
+                    pass
+
+                if chunks:
+                    log_file.write(''.join(chunks).encode('ascii'))
+                if done or time.monotonic() - last_flush >= 1.0:
+                    log_file.flush()
+                    last_flush = time.monotonic()
+        except Exception as e:
+            error = e
+            log.error(f"Data log write failed: {e}")
+
+        try:
+            log_file.close()
+        except OSError as e:
+            # After a failed write, close() retries the same buffered flush and fails the same way
+            log.error(f"Data log close failed: {e}")
+
+        if error is not None:
+            self.log_write_failed.emit(f"Data log write failed: {error}", log_queue)
+
+    def _on_log_write_failed(self, msg, log_queue):
+        self.log(msg)
+        # Only reset the session whose writer failed, not one started since
+        if self.logging_enabled and log_queue is self.log_queue:
+            self._stop_logging()
+            self.btn_toggle_log.setChecked(False)
+            self.btn_toggle_log.setText("Start Data Log")
 
     def update_buffer_len(self):
         try:
@@ -432,38 +857,71 @@ class ForzaTelemetryApp(QWidget):
 
         try:
             with open(path, newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                self.replay_data = list(reader)
+                reader = csv.reader(f)
+                headers = next(reader, [])
+                rows = list(reader)
+                self.replay_columns = self._parse_replay_columns(headers, rows)
+                self.replay_len = len(rows)
                 self.replay_index = 0
 
                 for chart in self.charts.values():
-                    chart.data.clear()
+                    chart.clear()
 
                 if not hasattr(self, 'slider'):
                     self.slider = QSlider(Qt.Horizontal)
                     self.slider.setMinimum(0)
-                    self.slider.setMaximum(len(self.replay_data) - 1)
+                    self.slider.setMaximum(self.replay_len - 1)
                     self.slider.valueChanged.connect(self.update_replay_frame)
                     self.layout().insertWidget(2, self.slider)
                 else:
-                    self.slider.setMaximum(len(self.replay_data) - 1)
+                    self.slider.setMaximum(self.replay_len - 1)
                     self.slider.setValue(0)
 
-                self.log(f"Loaded {len(self.replay_data)} frames from {path}")
+                self.log(f"Loaded {self.replay_len} frames from {path}")
 
         except Exception as e:
             self.log(f"Failed to read log file: {e}")
 
+    def _parse_replay_columns(self, headers, rows):
+        # Convert each charted column once up front so scrubbing only slices arrays.
+        def to_float(text):
+            try:
+                return float(text) if text else 0.0
+            except ValueError:
+                return 0.0
+
+        col_index = {name: i for i, name in enumerate(headers)}
+        columns = {}
+        for key in self.charts:
+            i = col_index.get(key)
+            if i is None:
+                columns[key] = array('f', bytes(4 * len(rows)))
+            else:
+                columns[key] = array('f', (to_float(row[i]) if i < len(row) else 0.0 for row in rows))
+        return columns
+
     def flush_data_buffer(self):
+        visible = self._visible_keys
         for key, vals in self.data_buffer.items():
-            if vals:
-                chart = self.charts.get(key)
-                if chart:
-                    chart.add_values(list(vals))
-                vals.clear()
-                
+            if not vals:
+                continue
+            chart = self.charts[key]
+            if key in visible:
+                chart.add_values(vals, self._skipped[key])
+                self._skipped[key] = 0
+                del vals[:]
+            elif len(vals) > chart.buffer_len:
+                # Hidden charts only ever need their last window of samples
+                self._skipped[key] += len(vals) - chart.buffer_len
+                del vals[:-chart.buffer_len]
+
+    def _on_tab_changed(self, index):
+        self._visible_keys = self._tab_keys[index] if 0 <= index < len(self._tab_keys) else set()
+        if self.update_timer.isActive():
+            self.flush_data_buffer()
+
     def update_replay_frame(self, index):
-        if not hasattr(self, 'replay_data') or index >= len(self.replay_data):
+        if not hasattr(self, 'replay_columns') or index >= self.replay_len:
             return
 
         window_size = 150
@@ -471,26 +929,7 @@ class ForzaTelemetryApp(QWidget):
         end = index + 1
 
         for key, chart in self.charts.items():
-            # Extract windowed data for this key from replay_data
-            try:
-                # Slice replay frames in window
-                vals = []
-                for i in range(start, end):
-                    frame_val = self.replay_data[i].get(key, '')
-                    vals.append(float(frame_val) if frame_val else 0.0)
-
-                chart.data = deque(vals, maxlen=window_size)
-                chart.add_values(list(chart.data))
-                # Lock y-axis range to fit data, pad slightly if flat
-                mn, mx = min(chart.data), max(chart.data)
-                if mn == mx:
-                    mn -= 0.1
-                    mx += 0.1
-                chart.axis_y.setRange(mn, mx)
-                chart.axis_x.setRange(0, len(chart.data) - 1)
-
-            except ValueError:
-                continue
+            chart.set_values(self.replay_columns[key][start:end], start)
 
     def start(self):
         self.receiver.start()
@@ -511,8 +950,11 @@ class ForzaTelemetryApp(QWidget):
             self._stop_logging()
 
         for chart in self.charts.values():
-            chart.data.clear()
-            chart.add_values([])
+            chart.clear()
+        for vals in self.data_buffer.values():
+            del vals[:]
+        self._skipped = dict.fromkeys(self.data_buffer, 0)
+        self.sample_count = 0
 
     def toggle_logging(self, checked):
         if checked:
@@ -527,10 +969,14 @@ class ForzaTelemetryApp(QWidget):
             return
         try:
             filename = f"telemetry_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            self.log_file = open(filename, 'w', newline='', encoding='utf-8')
-            self.csv_writer = csv.writer(self.log_file)
-            headers = ['timestamp'] + list(self.data_buffer.keys())
-            self.csv_writer.writerow(headers)
+            self.log_file = open(filename, 'wb', buffering=1 << 20)
+            headers = ('timestamp',) + self._csv_keys
+            self.log_file.write((','.join(headers) + '\r\n').encode('ascii'))
+            self.log_queue = queue.SimpleQueue()
+            self.log_thread = threading.Thread(
+                target=self._log_writer_loop, args=(self.log_file, self.log_queue), daemon=True
+            )
+            self.log_thread.start()
             self.logging_enabled = True
             self.log(f"Data logging started: {filename}")
             log.info(f"Data logging started: {filename}")
@@ -542,11 +988,12 @@ class ForzaTelemetryApp(QWidget):
         if not self.logging_enabled:
             return
         try:
-            with self.csv_lock:
-                self.log_file.close()
-                self.log_file = None
-                self.csv_writer = None
-                self.logging_enabled = False
+            self.logging_enabled = False
+            self.log_queue.put(None)
+            self.log_thread.join()
+            self.log_file = None
+            self.log_queue = None
+            self.log_thread = None
             self.log("Data logging stopped.")
             log.info("Data logging stopped.")
         except Exception as e:
@@ -554,7 +1001,15 @@ class ForzaTelemetryApp(QWidget):
             log.error(f"Failed to stop logging: {e}")
 
     def log(self, msg):
-        self.log_panel.append(msg)
+        self._log_pending.append(msg)
+        if not self.log_timer.isActive():
+            self.log_timer.start()
+
+    def _drain_log(self):
+        if not self._log_pending:
+            return
+        self.log_panel.append("\n".join(self._log_pending))
+        self._log_pending.clear()
         self.log_panel.ensureCursorVisible()
 
     def closeEvent(self, event):